@@ -91,6 +91,20 @@ def test_conformance(app):
     assert "Conformance" in response.text
 
 
+def test_invalid_nodata(app):
+    """Test invalid nodata value."""
+    response = app.get(
+        "/tiles/WebMercatorQuad/0/0/0",
+        params={
+            "concept_id": "C0000000000-PROVIDER",
+            "datetime": "2024-01-01T00:00:00Z",
+            "nodata": "abc",
+        },
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "nodata"]
+
+
 @pytest.mark.vcr
 def test_rasterio_statistics(app, mock_cmr_get_assets, mn_geojson):
     """Test /statistics endpoint for a polygon that straddles the boundary between two HLS granules"""
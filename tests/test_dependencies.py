@@ -1,6 +1,9 @@
 """test titiler-pgstac dependencies."""
 
+import math
+
 import pytest
+from fastapi.exceptions import RequestValidationError
 from starlette.requests import Request
 
 from titiler.cmr import dependencies
@@ -153,3 +156,17 @@ def test_cmr_query_more():
             concept_id="something",
             datetime="2019-02-12T09:00:00Z/2019-02-12",
         )
+
+
+def test_reader_params():
+    """test ReaderParams parsing."""
+    params = dependencies.ReaderParams()
+    assert params.nodata is None
+    assert params.reproject_method is None
+
+    assert dependencies.ReaderParams(nodata="0").nodata == 0.0
+    assert dependencies.ReaderParams(nodata=1).nodata == 1.0
+    assert math.isnan(dependencies.ReaderParams(nodata="nan").nodata)
+
+    with pytest.raises(RequestValidationError):
+        dependencies.ReaderParams(nodata="abc")
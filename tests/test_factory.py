@@ -0,0 +1,218 @@
+"""test titiler-cmr factory helpers."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pytest
+from cogeo_mosaic.errors import NoAssetFoundError
+from fastapi import FastAPI
+from geojson_pydantic import Feature, FeatureCollection, Polygon
+from rio_tiler.io import Reader
+from starlette.testclient import TestClient
+
+from titiler.cmr import factory, models
+from titiler.cmr.backend import CMRBackend
+from titiler.cmr.dependencies import RasterioParams, ReaderParams, ZarrParams
+from titiler.cmr.factory import Endpoints, create_crumbs, parse_reader_options
+from titiler.cmr.reader import MultiFilesBandsReader, ZarrReader
+
+
+def test_create_crumbs():
+    """test create_crumbs helper."""
+    assert create_crumbs("http://testserver", "/") == [
+        {"url": "http://testserver", "part": "Home"},
+        {"url": "http://testserver", "part": "Home"},
+    ]
+
+    assert create_crumbs("http://testserver", "/tileMatrixSets/WebMercatorQuad") == [
+        {"url": "http://testserver", "part": "Home"},
+        {"url": "http://testserver/tileMatrixSets", "part": "Tilematrixsets"},
+        {
+            "url": "http://testserver/tileMatrixSets/WebMercatorQuad",
+            "part": "Webmercatorquad",
+        },
+    ]
+
+    # trailing slash points back to the last crumb
+    assert create_crumbs("http://testserver", "/conformance/")[-1] == {
+        "url": "http://testserver/conformance",
+        "part": "Home",
+    }
+
+
+def test_parse_reader_options():
+    """test parse_reader_options."""
+    reader, read_options, reader_options = parse_reader_options(
+        RasterioParams(bands=["B01"], indexes=[1]),
+        ZarrParams(),
+        ReaderParams(),
+    )
+    assert reader == Reader
+    assert read_options == {"indexes": [1], "resampling_method": "nearest"}
+    assert reader_options == {}
+
+    reader, read_options, reader_options = parse_reader_options(
+        RasterioParams(bands=["B01"], bands_regex="B[0-9]+"),
+        ZarrParams(),
+        ReaderParams(),
+    )
+    assert reader == MultiFilesBandsReader
+    assert read_options == {"bands": ["B01"], "bands_regex": "B[0-9]+"}
+    assert reader_options == {}
+
+    reader, read_options, reader_options = parse_reader_options(
+        RasterioParams(),
+        ZarrParams(variable="sst"),
+        ReaderParams(backend="xarray"),
+    )
+    assert reader == ZarrReader
+    assert read_options == {}
+    assert reader_options == {"variable": "sst"}
+
+
+def test_tilejson_query_parameters():
+    """test tilejson forwards the query parameters to the tiles url."""
+    app = FastAPI()
+    app.state.cmr_auth = None
+    app.include_router(Endpoints().router)
+
+    with TestClient(app) as client:
+        response = client.get(
+            "/WebMercatorQuad/tilejson.json",
+            params={
+                "concept_id": "C0000000000-PROVIDER",
+                "datetime": "2024-01-01T00:00:00Z",
+                "tile_scale": 2,
+                "minzoom": 2,
+                "rescale": "0,10",
+            },
+        )
+        assert response.status_code == 200
+        resp = response.json()
+        assert resp["minzoom"] == 2
+        assert resp["tiles"][0] == (
+            "http://testserver/tiles/WebMercatorQuad/{z}/{x}/{y}@2x"
+            "?concept_id=C0000000000-PROVIDER"
+            "&datetime=2024-01-01T00%3A00%3A00Z&rescale=0%2C10"
+        )
+
+
+def test_url_for_prefix():
+    """test url_for with a router prefix."""
+    for prefix, path in [("", ""), ("/cmr", "/cmr"), ("/{name}", "/data")]:
+        app = FastAPI()
+        endpoints = Endpoints(router_prefix=prefix)
+        app.include_router(endpoints.router, prefix=prefix)
+
+        with TestClient(app) as client:
+            response = client.get(f"{path}/tileMatrixSets")
+            assert response.status_code == 200
+            link = response.json()["tileMatrixSets"][0]["links"][0]["href"]
+            assert link.startswith(f"http://testserver{path}/tileMatrixSets/")
+
+
+def test_tilematrixsets_model():
+    """test the tileMatrixSets list matches its response model."""
+    app = FastAPI()
+    endpoints = Endpoints(router_prefix="/cmr")
+    app.include_router(endpoints.router, prefix="/cmr")
+
+    with TestClient(app) as client:
+        response = client.get("/cmr/tileMatrixSets")
+        assert response.status_code == 200
+        body = response.json()
+        assert body == models.TileMatrixSetList(
+            tileMatrixSets=[
+                models.TileMatrixSetRef(
+                    id=tms_id,
+                    title=f"Definition of {tms_id} tileMatrixSets",
+                    links=[
+                        models.TileMatrixSetLink(
+                            href=f"http://testserver/cmr/tileMatrixSets/{tms_id}",
+                        )
+                    ],
+                )
+                for tms_id in endpoints.supported_tms.list()
+            ]
+        ).model_dump(exclude_none=True, mode="json")
+
+        for tms in body["tileMatrixSets"]:
+            response = client.get(tms["links"][0]["href"])
+            assert response.status_code == 200
+            assert response.json()["id"] == tms["id"]
+
+
+def test_statistics_threads(monkeypatch):
+    """test statistics split the threads between features and stop on error."""
+    threads = []
+    submitted = threading.Event()
+    release = threading.Event()
+
+    def feature(self, shape, **kwargs):
+        threads.append(kwargs["threads"])
+        # the first feature fails once every feature is submitted,
+        # the next ones wait until the request is done
+        if len(threads) > 1:
+            release.wait(timeout=5)
+        else:
+            submitted.wait(timeout=5)
+        raise NoAssetFoundError("No assets found for Geometry")
+
+    def _wait(futures, **kwargs):
+        submitted.set()
+        return wait(futures, **kwargs)
+
+    monkeypatch.setattr(CMRBackend, "feature", feature)
+    monkeypatch.setattr(factory, "wait", _wait)
+
+    app = FastAPI()
+    app.state.cmr_auth = None
+    app.include_router(Endpoints().router)
+
+    def _collection(n):
+        return FeatureCollection(
+            type="FeatureCollection",
+            features=[
+                Feature(
+                    type="Feature",
+                    properties={},
+                    geometry=Polygon.from_bounds(i, 0, i + 1, 1),
+                )
+                for i in range(n)
+            ],
+        ).model_dump(exclude_none=True)
+
+    params = {
+        "concept_id": "C0000000000-PROVIDER",
+        "backend": "xarray",
+        "variable": "sst",
+    }
+
+    with TestClient(app) as client:
+        monkeypatch.setattr(factory, "MOSAIC_THREADS", 4)
+        release.set()
+        with pytest.raises(NoAssetFoundError):
+            client.post(
+                "/statistics",
+                params=params,
+                json=_collection(2),
+            )
+        assert threads and set(threads) == {2}
+
+        # features waiting for a worker are not read after the first error
+        threads.clear()
+        submitted.clear()
+        release.clear()
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(factory, "STATISTICS_EXECUTOR", executor)
+        monkeypatch.setattr(factory, "MOSAIC_THREADS", 1)
+        with pytest.raises(NoAssetFoundError):
+            client.post(
+                "/statistics",
+                params=params,
+                json=_collection(8),
+            )
+        release.set()
+        executor.shutdown(wait=True)
+        # the worker may have started the second feature before the cancellation
+        assert threads in ([1], [1, 1])
@@ -0,0 +1,44 @@
+"""test titiler-cmr utils."""
+
+import pytest
+
+from titiler.cmr.utils import retry
+
+
+def test_retry():
+    """test retry decorator."""
+    calls = []
+
+    @retry(tries=2, exceptions=ValueError)
+    def failing():
+        calls.append(1)
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        failing()
+    # first call + 2 retries
+    assert len(calls) == 3
+
+    calls.clear()
+
+    @retry(tries=2, exceptions=ValueError)
+    def flaky():
+        calls.append(1)
+        if len(calls) < 2:
+            raise ValueError("failed")
+        return "ok"
+
+    assert flaky() == "ok"
+    assert len(calls) == 2
+
+    calls.clear()
+
+    # exceptions not listed are not retried
+    @retry(tries=2, exceptions=ValueError)
+    def type_error():
+        calls.append(1)
+        raise TypeError("failed")
+
+    with pytest.raises(TypeError):
+        type_error()
+    assert len(calls) == 1
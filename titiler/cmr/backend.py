@@ -2,6 +2,7 @@
 
 import os
 import re
+from threading import Lock
 from typing import Any, Dict, List, Literal, Optional, Tuple, Type, TypedDict, Union
 
 import attr
@@ -37,6 +38,7 @@ s3_auth_config = AuthSettings()
 @cached(  # type: ignore
     TTLCache(maxsize=100, ttl=60),
     key=lambda auth, daac: hashkey(auth.tokens[0]["access_token"], daac),
+    lock=Lock(),
 )
 def aws_s3_credential(auth: Auth, provider: str) -> Dict:
     """Get AWS S3 credential through earthaccess."""
@@ -155,6 +157,7 @@ class CMRBackend(BaseBackend):
         key=lambda self, xmin, ymin, xmax, ymax, **kwargs: hashkey(
             xmin, ymin, xmax, ymax, **kwargs
         ),
+        lock=Lock(),
     )
     @retry(
         tries=retry_config.retry,
@@ -4,8 +4,10 @@ import datetime as python_datetime
 from dataclasses import dataclass
 from typing import Any, Dict, List, Literal, Optional, Union, get_args
 
+import numpy
 from ciso8601 import parse_rfc3339
 from fastapi import Query
+from fastapi.exceptions import RequestValidationError
 from rio_tiler.types import RIOResampling, WarpResampling
 from starlette.requests import Request
 from typing_extensions import Annotated
@@ -241,3 +243,20 @@ class ReaderParams(DefaultDependency):
             description="WarpKernel resampling algorithm (only used when doing re-projection). Defaults to `nearest`.",
         ),
     ] = None
+
+    def __post_init__(self):
+        """Post Init."""
+        if self.nodata is not None:
+            try:
+                self.nodata = numpy.nan if self.nodata == "nan" else float(self.nodata)
+            except ValueError as e:
+                raise RequestValidationError(
+                    [
+                        {
+                            "type": "float_parsing",
+                            "loc": ("query", "nodata"),
+                            "msg": "Input should be a valid number or `nan`",
+                            "input": self.nodata,
+                        }
+                    ]
+                ) from e
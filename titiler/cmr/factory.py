@@ -1,14 +1,12 @@
 """titiler.cmr.factory: router factories."""
 
-import json
 import os
-import re
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Any, Dict, Literal, Optional, Tuple, Type, Union
-from urllib.parse import urlencode
+from itertools import accumulate
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
 
 import jinja2
-import numpy
 import orjson
 from fastapi import Body, Depends, Path, Query
 from fastapi.responses import ORJSONResponse
@@ -35,6 +33,8 @@ from titiler.cmr.dependencies import (
 )
 from titiler.cmr.enums import MediaType
 from titiler.cmr.reader import MultiFilesBandsReader, ZarrReader
+from titiler.cmr.responses import GeoJSONResponse
+from titiler.cmr.settings import ApiSettings
 from titiler.core.algorithm import algorithms as available_algorithms
 from titiler.core.dependencies import (
     CoordCRSParams,
@@ -48,40 +48,80 @@ from titiler.core.factory import BaseTilerFactory, img_endpoint_params
 from titiler.core.models.mapbox import TileJSON
 from titiler.core.models.responses import MultiBaseStatisticsGeoJSON
 from titiler.core.resources.enums import ImageType, OptionalHeader
-from titiler.core.resources.responses import GeoJSONResponse
 from titiler.core.utils import render_image
 
+api_config = ApiSettings()
+
+# Templates are static within a deployment: keep every compiled template in
+# memory (no mtime checks) and optionally persist the bytecode on disk.
 jinja2_env = jinja2.Environment(
-    loader=jinja2.ChoiceLoader([jinja2.PackageLoader(__package__, "templates")])
+    loader=jinja2.ChoiceLoader([jinja2.PackageLoader(__package__, "templates")]),
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=(
+        jinja2.FileSystemBytecodeCache(api_config.template_cache_dir)
+        if api_config.template_cache_dir
+        else None
+    ),
 )
+
 DEFAULT_TEMPLATES = Jinja2Templates(env=jinja2_env)
 
 MOSAIC_THREADS = int(os.getenv("MOSAIC_CONCURRENCY", MAX_THREADS))
 
+# Features from `/statistics` requests are processed in a shared pool so the
+# number of features read at once (each one running its own CMR search) is
+# bounded for the whole process, not per request.
+STATISTICS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MOSAIC_THREADS, thread_name_prefix="titiler-cmr-statistics"
+)
+
+TILEJSON_QS_KEYS_TO_REMOVE = frozenset(
+    {"tilematrixsetid", "tile_format", "tile_scale", "minzoom", "maxzoom"}
+)
+
+
+def load_templates(templates: Jinja2Templates) -> None:
+    """Compile the HTML templates so the first requests don't have to."""
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
+
+
+def create_crumbs(baseurl: str, urlpath: str) -> List[Dict[str, str]]:
+    """Create breadcrumbs from a URL path.
+
+    `baseurl` is expected without trailing slash. Empty path segments are
+    labeled `Home` and point to the current (parent) url.
+
+    """
+    parts = urlpath.split("/")
+    # path segments never contain `/` so we only need to extend
+    # the url when the segment is not empty (no trailing slash to strip)
+    urls = accumulate(
+        parts,
+        lambda url, part: f"{url}/{part}" if part else url,
+        initial=baseurl,
+    )
+    next(urls)
+
+    return [
+        {"url": url, "part": (part or "Home").capitalize()}
+        for url, part in zip(urls, parts)
+    ]
+
 
 def create_html_response(
     request: Request,
-    data: str,
+    data: Dict[str, Any],
     templates: Jinja2Templates,
     template_name: str,
     router_prefix: Optional[str] = None,
 ) -> _TemplateResponse:
     """Create Template response."""
-    urlpath = request.url.path
-    if root_path := request.app.root_path:
-        urlpath = re.sub(r"^" + root_path, "", urlpath)
+    urlpath = request.url.path.removeprefix(request.app.root_path)
 
-    crumbs = []
     baseurl = str(request.base_url).rstrip("/")
-
-    crumbpath = str(baseurl)
-    for crumb in urlpath.split("/"):
-        crumbpath = crumbpath.rstrip("/")
-        part = crumb
-        if part is None or part == "":
-            part = "Home"
-        crumbpath += f"/{crumb}"
-        crumbs.append({"url": crumbpath.rstrip("/"), "part": part.capitalize()})
+    crumbs = create_crumbs(baseurl, urlpath)
 
     if router_prefix:
         baseurl += router_prefix
@@ -90,7 +130,7 @@ def create_html_response(
         request=request,
         name=f"{template_name}.html",
         context={
-            "response": orjson.loads(data),
+            "response": data,
             "template": {
                 "api_root": baseurl,
                 "params": request.query_params,
@@ -186,7 +226,7 @@ class Endpoints(BaseTilerFactory):
     def _create_html_response(
         self,
         request: Request,
-        data: str,
+        data: Dict[str, Any],
         template_name: str,
     ) -> _TemplateResponse:
         return create_html_response(
@@ -197,8 +237,37 @@ class Endpoints(BaseTilerFactory):
             router_prefix=self.router_prefix,
         )
 
+    def _resolve_prefix(self, request: Request) -> str:
+        """Return the router prefix (without leading `/`) for a request."""
+        if self._prefix_convertors:
+            prefix, _ = replace_params(
+                self._prefix_format,
+                self._prefix_convertors,
+                request.path_params.copy(),
+            )
+            return prefix
+
+        return self._prefix_format
+
+    def url_for(self, request: Request, name: str, **path_params: Any) -> str:
+        """Return full url (with prefix) for a specific endpoint."""
+        url_path = self.router.url_path_for(name, **path_params)
+        base_url = str(request.base_url) + self._resolve_prefix(request)
+        return str(url_path.make_absolute_url(base_url=base_url))
+
     def register_routes(self):
         """Post Init: register routes."""
+        # supported TMS are fixed, list them once for all the routes
+        self._tms_ids = tuple(self.supported_tms.list())
+
+        # If we have prefix with custom path param we compile it once and replace
+        # them with the path params provided in the request (see `url_for`)
+        self._prefix_format = (self.router_prefix or "").lstrip("/")
+        self._prefix_convertors = None
+        if "{" in self._prefix_format:
+            _, self._prefix_format, self._prefix_convertors = compile_path(
+                self._prefix_format
+            )
 
         self.register_landing()
         self.register_conformance()
@@ -210,6 +279,24 @@ class Endpoints(BaseTilerFactory):
 
     def register_landing(self) -> None:
         """register landing page endpoint."""
+        # External links do not depend on the request
+        doc_links = [
+            link.model_dump(exclude_none=True, mode="json")
+            for link in [
+                models.Link(
+                    title="TiTiler-CMR Documentation (external link)",
+                    href="https://developmentseed.org/titiler-cmr/",
+                    type=MediaType.html,
+                    rel="doc",
+                ),
+                models.Link(
+                    title="TiTiler-CMR source code (external link)",
+                    href="https://github.com/developmentseed/titiler-cmr",
+                    type=MediaType.html,
+                    rel="doc",
+                ),
+            ]
+        ]
 
         @self.router.get(
             "/",
@@ -228,64 +315,72 @@ class Endpoints(BaseTilerFactory):
             summary="landing page",
             tags=["Landing Page"],
         )
-        def landing(
+        async def landing(
             request: Request,
             output_type: Annotated[Optional[MediaType], Depends(OutputType)] = None,
         ):
             """The landing page provides links to the API definition, the conformance statements and to the feature collections in this dataset."""
-            data = models.Landing(
-                title=self.title,
-                links=[
-                    models.Link(
-                        title="Landing Page",
-                        href=self.url_for(request, "landing"),
-                        type=MediaType.html,
-                        rel="self",
-                    ),
-                    models.Link(
-                        title="the API definition (JSON)",
-                        href=str(request.url_for("openapi")),
-                        type=MediaType.openapi30_json,
-                        rel="service-desc",
-                    ),
-                    models.Link(
-                        title="the API documentation",
-                        href=str(request.url_for("swagger_ui_html")),
-                        type=MediaType.html,
-                        rel="service-doc",
-                    ),
-                    models.Link(
-                        title="Conformance",
-                        href=self.url_for(request, "conformance"),
-                        type=MediaType.json,
-                        rel="conformance",
-                    ),
-                    models.Link(
-                        title="TiTiler-CMR Documentation (external link)",
-                        href="https://developmentseed.org/titiler-cmr/",
-                        type=MediaType.html,
-                        rel="doc",
-                    ),
-                    models.Link(
-                        title="TiTiler-CMR source code (external link)",
-                        href="https://github.com/developmentseed/titiler-cmr",
-                        type=MediaType.html,
-                        rel="doc",
-                    ),
+            url_for = self.url_for
+            # Same document as `models.Landing`, built without model validation
+            content = {
+                "title": self.title,
+                "links": [
+                    {
+                        "href": url_for(request, "landing"),
+                        "rel": "self",
+                        "type": MediaType.html.value,
+                        "title": "Landing Page",
+                    },
+                    {
+                        "href": str(request.url_for("openapi")),
+                        "rel": "service-desc",
+                        "type": MediaType.openapi30_json.value,
+                        "title": "the API definition (JSON)",
+                    },
+                    {
+                        "href": str(request.url_for("swagger_ui_html")),
+                        "rel": "service-doc",
+                        "type": MediaType.html.value,
+                        "title": "the API documentation",
+                    },
+                    {
+                        "href": url_for(request, "conformance"),
+                        "rel": "conformance",
+                        "type": MediaType.json.value,
+                        "title": "Conformance",
+                    },
+                    *doc_links,
                 ],
-            )
+            }
 
-            if output_type == MediaType.html:
+            if output_type is MediaType.html:
                 return self._create_html_response(
                     request,
-                    data.model_dump_json(exclude_none=True),
+                    content,
                     template_name="landing",
                 )
 
-            return data
+            return ORJSONResponse(content)
 
     def register_conformance(self) -> None:
         """Register conformance endpoint."""
+        # The conformance declaration is static, encode it once
+        data = models.Conformance(
+            # TODO: Validate / Update
+            conformsTo=[
+                "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/core",
+                "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/landing-page",
+                "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/json",
+                "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/html",
+                "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/oas30",
+                "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/core",
+                "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/oas30",
+                "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/tileset",
+                "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/tilesets-list",
+            ]
+        )
+        content = data.model_dump(exclude_none=True, mode="json")
+        body = orjson.dumps(content)
 
         @self.router.get(
             "/conformance",
@@ -304,37 +399,32 @@ class Endpoints(BaseTilerFactory):
             summary="information about specifications that this API conforms to",
             tags=["Conformance"],
         )
-        def conformance(
+        async def conformance(
             request: Request,
             output_type: Annotated[Optional[MediaType], Depends(OutputType)] = None,
         ):
             """A list of all conformance classes specified in a standard that the server conforms to."""
-            data = models.Conformance(
-                # TODO: Validate / Update
-                conformsTo=[
-                    "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/core",
-                    "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/landing-page",
-                    "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/json",
-                    "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/html",
-                    "http://www.opengis.net/spec/ogcapi-common-1/1.0/conf/oas30",
-                    "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/core",
-                    "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/oas30",
-                    "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/tileset",
-                    "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/tilesets-list",
-                ]
-            )
-
-            if output_type == MediaType.html:
+            if output_type is MediaType.html:
                 return self._create_html_response(
                     request,
-                    data.model_dump_json(exclude_none=True),
+                    content,
                     template_name="conformance",
                 )
 
-            return data
+            return Response(body, media_type=MediaType.json.value)
 
     def register_tilematrixsets(self):
         """Register Tiling Schemes endpoints."""
+        # Only the base url of the TMS list links depends on the request,
+        # resolve the titles and the tilematrixset paths once
+        tms_refs = [
+            (
+                tms_id,
+                f"Definition of {tms_id} tileMatrixSets",
+                f"/tileMatrixSets/{tms_id}",
+            )
+            for tms_id in self._tms_ids
+        ]
 
         @self.router.get(
             r"/tileMatrixSets",
@@ -357,35 +447,51 @@ class Endpoints(BaseTilerFactory):
             output_type: Annotated[Optional[MediaType], Depends(OutputType)] = None,
         ):
             """Retrieve the list of available tiling schemes (tile matrix sets)."""
-            data = models.TileMatrixSetList(
-                tileMatrixSets=[
-                    models.TileMatrixSetRef(
-                        id=tms_id,
-                        title=f"Definition of {tms_id} tileMatrixSets",
-                        links=[
-                            models.TileMatrixSetLink(
-                                href=self.url_for(
-                                    request,
-                                    "tilematrixset",
-                                    tileMatrixSetId=tms_id,
-                                ),
-                                rel="http://www.opengis.net/def/rel/ogc/1.0/tiling-schemes",
-                                type=MediaType.json,
-                            )
+            base_url = f"{request.base_url}{self._resolve_prefix(request)}".rstrip("/")
+            # Same document as `models.TileMatrixSetList` (see `tms_refs`)
+            content = {
+                "tileMatrixSets": [
+                    {
+                        "id": tms_id,
+                        "title": title,
+                        "links": [
+                            {
+                                "href": f"{base_url}{path}",
+                                "rel": "http://www.opengis.net/def/rel/ogc/1.0/tiling-schemes",
+                                "type": MediaType.json.value,
+                            }
                         ],
-                    )
-                    for tms_id in self.supported_tms.list()
+                    }
+                    for tms_id, title, path in tms_refs
                 ]
-            )
+            }
 
-            if output_type == MediaType.html:
+            if output_type is MediaType.html:
                 return self._create_html_response(
                     request,
-                    data.model_dump_json(exclude_none=True),
+                    content,
                     template_name="tilematrixsets",
                 )
 
-            return data
+            return ORJSONResponse(content)
+
+        # TMS definitions are static, build the JSON documents and the HTML
+        # template data once.
+        tms_bodies: Dict[str, bytes] = {}
+        tms_html_data: Dict[str, Dict[str, Any]] = {}
+        for tms_id in self._tms_ids:
+            tms = self.supported_tms.get(tms_id)
+            # Morecantile TileMatrixSet should be the same as `models.TileMatrixSet`
+            tms_bodies[tms_id] = orjson.dumps(
+                models.TileMatrixSet.model_validate(tms.model_dump()).model_dump(
+                    exclude_none=True, by_alias=True, mode="json"
+                )
+            )
+            # For visualization purpose we add the tms bbox
+            tms_html_data[tms_id] = {
+                **tms.model_dump(exclude_none=True, mode="json"),
+                "bbox": list(tms.bbox),  # morecantile attribute
+            }
 
         @self.router.get(
             "/tileMatrixSets/{tileMatrixSetId}",
@@ -406,30 +512,22 @@ class Endpoints(BaseTilerFactory):
         async def tilematrixset(
             request: Request,
             tileMatrixSetId: Annotated[
-                Literal[tuple(self.supported_tms.list())],
+                Literal[self._tms_ids],
                 Path(description="Identifier for a supported TileMatrixSet."),
             ],
             output_type: Annotated[Optional[MediaType], Depends(OutputType)] = None,
         ):
             """Retrieve the definition of the specified tiling scheme (tile matrix set)."""
-            # Morecantile TileMatrixSet should be the same as `models.TileMatrixSet`
-            tms = self.supported_tms.get(tileMatrixSetId)
-            data = models.TileMatrixSet.model_validate(tms.model_dump())
-
-            if output_type == MediaType.html:
+            if output_type is MediaType.html:
                 return self._create_html_response(
                     request,
-                    # For visualization purpose we add the tms bbox
-                    json.dumps(
-                        {
-                            **tms.model_dump(exclude_none=True, mode="json"),
-                            "bbox": tms.bbox,  # morecantile attribute
-                        },
-                    ),
+                    tms_html_data[tileMatrixSetId],
                     template_name="tilematrixset",
                 )
 
-            return data
+            return Response(
+                tms_bodies[tileMatrixSetId], media_type=MediaType.json.value
+            )
 
     def register_tiles(self):  # noqa: C901
         """Register tileset endpoints."""
@@ -457,7 +555,7 @@ class Endpoints(BaseTilerFactory):
         def tiles_endpoint(
             request: Request,
             tileMatrixSetId: Annotated[
-                Literal[tuple(self.supported_tms.list())],
+                Literal[self._tms_ids],
                 Path(description="Identifier for a supported TileMatrixSet"),
             ],
             z: Annotated[
@@ -496,17 +594,6 @@ class Endpoints(BaseTilerFactory):
             render_params=Depends(self.render_dependency),
         ) -> Response:
             """Create map tile from a dataset."""
-            reproject_method = reader_params.reproject_method or "nearest"
-            nodata = (
-                (
-                    numpy.nan
-                    if reader_params.nodata == "nan"
-                    else float(reader_params.nodata)
-                )
-                if reader_params.nodata
-                else None
-            )
-
             tms = self.supported_tms.get(tileMatrixSetId)
 
             reader, read_options, reader_options = parse_reader_options(
@@ -527,8 +614,9 @@ class Endpoints(BaseTilerFactory):
                     z,
                     tilesize=scale * 256,
                     cmr_query=query,
-                    nodata=nodata,
-                    reproject_method=reproject_method,
+                    nodata=reader_params.nodata,
+                    reproject_method=reader_params.reproject_method or "nearest",
+                    threads=MOSAIC_THREADS,
                     **read_options,
                 )
 
@@ -560,7 +648,7 @@ class Endpoints(BaseTilerFactory):
         def tilejson_endpoint(  # type: ignore
             request: Request,
             tileMatrixSetId: Annotated[
-                Literal[tuple(self.supported_tms.list())],
+                Literal[self._tms_ids],
                 Path(description="Identifier for a supported TileMatrixSet"),
             ],
             tile_format: Annotated[
@@ -592,7 +680,7 @@ class Endpoints(BaseTilerFactory):
             color_formula=Depends(self.color_formula_dependency),
             colormap=Depends(self.colormap_dependency),
             render_params=Depends(self.render_dependency),
-        ) -> Dict:
+        ) -> Response:
             """Return TileJSON document for a dataset."""
             route_params = {
                 "z": "{z}",
@@ -606,20 +694,15 @@ class Endpoints(BaseTilerFactory):
 
             tiles_url = self.url_for(request, "tiles_endpoint", **route_params)
 
-            qs_key_to_remove = [
-                "tilematrixsetid",
-                "tile_format",
-                "tile_scale",
-                "minzoom",
-                "maxzoom",
-            ]
-            qs = [
-                (key, value)
-                for (key, value) in request.query_params._list
-                if key.lower() not in qs_key_to_remove
-            ]
+            # forward the (already encoded) query string minus the tilejson options
+            qs = "&".join(
+                param
+                for param in request.url.query.split("&")
+                if param
+                and param.split("=", 1)[0].lower() not in TILEJSON_QS_KEYS_TO_REMOVE
+            )
             if qs:
-                tiles_url += f"?{urlencode(qs)}"
+                tiles_url += f"?{qs}"
 
             tms = self.supported_tms.get(tileMatrixSetId)
 
@@ -628,17 +711,22 @@ class Endpoints(BaseTilerFactory):
                 tms=tms,
                 auth=request.app.state.cmr_auth,
             ) as src_dst:
-                minx, miny, maxx, maxy = zip(
-                    [-180, -90, 180, 90], list(src_dst.geographic_bounds)
+                minx, miny, maxx, maxy = src_dst.geographic_bounds
+                bounds = [
+                    max(minx, -180),
+                    max(miny, -90),
+                    min(maxx, 180),
+                    min(maxy, 90),
+                ]
+
+                data = TileJSON(
+                    bounds=bounds,
+                    minzoom=minzoom if minzoom is not None else src_dst.minzoom,
+                    maxzoom=maxzoom if maxzoom is not None else src_dst.maxzoom,
+                    tiles=[tiles_url],
                 )
-                bounds = [max(minx), max(miny), min(maxx), min(maxy)]
 
-                return {
-                    "bounds": bounds,
-                    "minzoom": minzoom if minzoom is not None else src_dst.minzoom,
-                    "maxzoom": maxzoom if maxzoom is not None else src_dst.maxzoom,
-                    "tiles": [tiles_url],
-                }
+            return ORJSONResponse(data.model_dump(exclude_none=True, mode="json"))
 
     def register_map(self):  # noqa: C901
         """Register map endpoints."""
@@ -652,7 +740,7 @@ class Endpoints(BaseTilerFactory):
         def map_endpoint(  # type: ignore
             request: Request,
             tileMatrixSetId: Annotated[
-                Literal[tuple(self.supported_tms.list())],
+                Literal[self._tms_ids],
                 Path(description="Identifier for a supported TileMatrixSet"),
             ],
             minzoom: Annotated[
@@ -682,22 +770,13 @@ class Endpoints(BaseTilerFactory):
                 "tilejson_endpoint",
                 tileMatrixSetId=tileMatrixSetId,
             )
-            if request.query_params._list:
-                tilejson_url += f"?{urlencode(request.query_params._list)}"
+            if qs := request.url.query:
+                tilejson_url += f"?{qs}"
 
             tms = self.supported_tms.get(tileMatrixSetId)
 
-            base_url = str(request.base_url).rstrip("/")
-            if self.router_prefix:
-                prefix = self.router_prefix.lstrip("/")
-                # If we have prefix with custom path param we check and replace them with
-                # the path params provided
-                if "{" in prefix:
-                    _, path_format, param_convertors = compile_path(prefix)
-                    prefix, _ = replace_params(
-                        path_format, param_convertors, request.path_params.copy()
-                    )
-                base_url += prefix
+            prefix = self._resolve_prefix(request)
+            base_url = f"{request.base_url}{prefix}".rstrip("/")
 
             return self.templates.TemplateResponse(
                 request=request,
@@ -868,7 +947,8 @@ class Endpoints(BaseTilerFactory):
                     read_options.update(image_params)
 
                 image, assets = src_dst.feature(
-                    geojson.model_dump(exclude_none=True),
+                    # properties are not needed to read the data
+                    geojson.model_dump(exclude={"properties"}, exclude_none=True),
                     cmr_query=query,
                     shape_crs=coord_crs or WGS84_CRS,
                     dst_crs=dst_crs,
@@ -932,9 +1012,11 @@ class Endpoints(BaseTilerFactory):
             image_params=Depends(self.img_part_dependency),
         ):
             """Get Statistics from a geojson feature or featureCollection."""
-            fc = geojson
-            if isinstance(fc, Feature):
-                fc = FeatureCollection(type="FeatureCollection", features=[geojson])
+            features = (
+                geojson.features
+                if isinstance(geojson, FeatureCollection)
+                else [geojson]
+            )
 
             reader, read_options, reader_options = parse_reader_options(
                 rasterio_params=rasterio_params,
@@ -942,51 +1024,69 @@ class Endpoints(BaseTilerFactory):
                 reader_params=reader_params,
             )
 
-            with CMRBackend(
-                reader=reader,
-                reader_options=reader_options,
-                auth=request.app.state.cmr_auth,
-            ) as src_dst:
-                for feature in fc:
-                    shape = feature.model_dump(exclude_none=True)
+            # Features are read concurrently, each one with its own mosaic
+            # reader threads: split the thread budget between them
+            workers = min(len(features), MOSAIC_THREADS) or 1
+            read_options["threads"] = max(1, MOSAIC_THREADS // workers)
 
-                    if reader_params.backend == "rasterio":
-                        read_options.update(
-                            {
-                                "threads": MOSAIC_THREADS,
-                                "align_bounds_with_dataset": True,
-                            }
-                        )
+            if reader_params.backend == "rasterio":
+                read_options.update({"align_bounds_with_dataset": True})
+                read_options.update(image_params)
 
-                        read_options.update(image_params)
+            shape_crs = coord_crs or WGS84_CRS
 
-                    image, _ = src_dst.feature(
-                        shape,
-                        cmr_query=query,
-                        shape_crs=coord_crs or WGS84_CRS,
-                        dst_crs=dst_crs,
-                        **read_options,
-                    )
+            def _feature_statistics(src_dst: CMRBackend, feature: Feature) -> Dict:
+                # properties are not needed to read the data and the coverage
+                shape = feature.model_dump(exclude={"properties"}, exclude_none=True)
 
-                    coverage_array = image.get_coverage_array(
-                        shape,
-                        shape_crs=coord_crs or WGS84_CRS,
-                    )
+                image, _ = src_dst.feature(
+                    shape,
+                    cmr_query=query,
+                    shape_crs=shape_crs,
+                    dst_crs=dst_crs,
+                    **read_options,
+                )
 
-                    if post_process:
-                        image = post_process(image)
+                coverage_array = image.get_coverage_array(
+                    shape,
+                    shape_crs=shape_crs,
+                )
 
-                    # set band name for statistics method
-                    if not image.band_names and reader_params.backend == "xarray":
-                        image.band_names = [zarr_params.variable]
+                if post_process:
+                    image = post_process(image)
 
-                    stats = image.statistics(
-                        **stats_params,
-                        hist_options={**histogram_params},
-                        coverage=coverage_array,
-                    )
+                # set band name for statistics method
+                if not image.band_names and reader_params.backend == "xarray":
+                    image.band_names = [zarr_params.variable]
+
+                return image.statistics(
+                    **stats_params,
+                    hist_options={**histogram_params},
+                    coverage=coverage_array,
+                )
+
+            with CMRBackend(
+                reader=reader,
+                reader_options=reader_options,
+                auth=request.app.state.cmr_auth,
+            ) as src_dst:
+                # Features are independent, process them concurrently
+                futures = [
+                    STATISTICS_EXECUTOR.submit(_feature_statistics, src_dst, feature)
+                    for feature in features
+                ]
+
+                # Do not read the remaining features if one fails
+                done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+                if pending:
+                    for future in pending:
+                        future.cancel()
+
+                    for future in done:
+                        future.result()
 
+                for feature, future in zip(features, futures):
                     feature.properties = feature.properties or {}
-                    feature.properties.update({"statistics": stats})
+                    feature.properties.update({"statistics": future.result()})
 
-            return fc.features[0] if isinstance(geojson, Feature) else fc
+            return geojson
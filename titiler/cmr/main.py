@@ -3,28 +3,19 @@
 from contextlib import asynccontextmanager
 
 import earthaccess
-import jinja2
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
-from starlette.templating import Jinja2Templates
 
 from titiler.cmr import __version__ as titiler_cmr_version
 from titiler.cmr.errors import DEFAULT_STATUS_CODES as CMR_STATUS_CODES
-from titiler.cmr.factory import Endpoints
+from titiler.cmr.factory import DEFAULT_TEMPLATES, Endpoints, load_templates
 from titiler.cmr.settings import ApiSettings, AuthSettings
 from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
 from titiler.core.middleware import CacheControlMiddleware, LoggerMiddleware
 from titiler.mosaic.errors import MOSAIC_STATUS_CODES
 
-jinja2_env = jinja2.Environment(
-    loader=jinja2.ChoiceLoader(
-        [
-            jinja2.PackageLoader(__package__, "templates"),
-        ]
-    ),
-)
-templates = Jinja2Templates(env=jinja2_env)
-
 settings = ApiSettings()
 auth_config = AuthSettings()
 
@@ -32,8 +23,12 @@ auth_config = AuthSettings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI Lifespan."""
+    load_templates(DEFAULT_TEMPLATES)
+
     if auth_config.strategy == "environment" and auth_config.access == "direct":
-        app.state.cmr_auth = earthaccess.login(strategy="environment")
+        app.state.cmr_auth = await run_in_threadpool(
+            earthaccess.login, strategy="environment"
+        )
     else:
         app.state.cmr_auth = None
 
@@ -57,11 +52,12 @@ app = FastAPI(
     version=titiler_cmr_version,
     root_path=settings.root_path,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-add_exception_handlers(app, DEFAULT_STATUS_CODES)
-add_exception_handlers(app, MOSAIC_STATUS_CODES)
-add_exception_handlers(app, CMR_STATUS_CODES)
+add_exception_handlers(
+    app, {**DEFAULT_STATUS_CODES, **MOSAIC_STATUS_CODES, **CMR_STATUS_CODES}
+)
 
 # Set all CORS enabled origins
 if settings.cors_origins:
@@ -82,6 +78,6 @@ if settings.debug:
 # application endpoints
 endpoints = Endpoints(
     title=settings.name,
-    templates=templates,
+    templates=DEFAULT_TEMPLATES,
 )
 app.include_router(endpoints.router)
@@ -9,7 +9,17 @@ from typing_extensions import Annotated
 from titiler.cmr.enums import MediaType
 
 
-class Link(BaseModel):
+class _Model(BaseModel):
+    """Base model for the OGC API models.
+
+    Most models only document the OGC schemas, so we build their validators
+    and serializers when first used instead of at import.
+    """
+
+    model_config = {"defer_build": True}
+
+
+class Link(_Model):
     """Link model.
 
     Ref: https://github.com/opengeospatial/ogcapi-tiles/blob/master/openapi/schemas/common-core/link.yaml
@@ -67,7 +77,7 @@ class Link(BaseModel):
     model_config = {"use_enum_values": True}
 
 
-class CRSUri(BaseModel):
+class CRSUri(_Model):
     """Coordinate Reference System (CRS) from URI."""
 
     uri: Annotated[
@@ -82,7 +92,7 @@ class CRSUri(BaseModel):
     ]
 
 
-class CRSWKT(BaseModel):
+class CRSWKT(_Model):
     """Coordinate Reference System (CRS) from WKT."""
 
     wkt: Annotated[
@@ -96,7 +106,7 @@ class CRSWKT(BaseModel):
     ]
 
 
-class CRSRef(BaseModel):
+class CRSRef(_Model):
     """CRS from referenceSystem."""
 
     referenceSystem: Dict[str, Any] = Field(
@@ -113,8 +123,10 @@ class CRS(RootModel[Union[str, Union[CRSUri, CRSWKT, CRSRef]]]):
     Code generated using https://github.com/koxudaxi/datamodel-code-generator/
     """
 
+    model_config = {"defer_build": True}
+
 
-class Spatial(BaseModel):
+class Spatial(_Model):
     """Spatial Extent model.
 
     Ref: http://schemas.opengis.net/ogcapi/features/part1/1.0/openapi/schemas/extent.yaml
@@ -130,7 +142,7 @@ class Spatial(BaseModel):
     crs: str = "http://www.opengis.net/def/crs/OGC/1.3/CRS84"
 
 
-class Temporal(BaseModel):
+class Temporal(_Model):
     """Temporal Extent model.
 
     Ref: http://schemas.opengis.net/ogcapi/features/part1/1.0/openapi/schemas/extent.yaml
@@ -147,7 +159,7 @@ class Temporal(BaseModel):
     trs: str = "http://www.opengis.net/def/uom/ISO-8601/0/Gregorian"
 
 
-class Extent(BaseModel):
+class Extent(_Model):
     """Extent model.
 
     Ref: http://schemas.opengis.net/ogcapi/features/part1/1.0/openapi/schemas/extent.yaml
@@ -158,7 +170,7 @@ class Extent(BaseModel):
     temporal: Optional[Temporal] = None
 
 
-class Collection(BaseModel):
+class Collection(_Model):
     """Collection model.
 
     Note: `CRS` is the list of CRS supported by the service not the CRS of the collection
@@ -196,7 +208,7 @@ class Collection(BaseModel):
         return None
 
 
-class Collections(BaseModel):
+class Collections(_Model):
     """
     Collections model.
 
@@ -213,7 +225,7 @@ class Collections(BaseModel):
     model_config = {"extra": "allow"}
 
 
-class Conformance(BaseModel):
+class Conformance(_Model):
     """Conformance model.
 
     Ref: http://schemas.opengis.net/ogcapi/features/part1/1.0/openapi/schemas/confClasses.yaml
@@ -223,7 +235,7 @@ class Conformance(BaseModel):
     conformsTo: List[str]
 
 
-class Landing(BaseModel):
+class Landing(_Model):
     """Landing page model.
 
     Ref: http://schemas.opengis.net/ogcapi/features/part1/1.0/openapi/schemas/landingPage.yaml
@@ -235,7 +247,7 @@ class Landing(BaseModel):
     links: List[Link]
 
 
-class Queryables(BaseModel):
+class Queryables(_Model):
     """Queryables model.
 
     Ref: https://docs.ogc.org/DRAFTS/19-079r1.html#filter-queryables
@@ -253,7 +265,7 @@ class Queryables(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class TileMatrixSetLink(BaseModel):
+class TileMatrixSetLink(_Model):
     """
     TileMatrixSetLink model.
     Based on http://docs.opengeospatial.org/per/19-069.html#_tilematrixsets
@@ -266,7 +278,7 @@ class TileMatrixSetLink(BaseModel):
     model_config = {"use_enum_values": True}
 
 
-class TileMatrixSetRef(BaseModel):
+class TileMatrixSetRef(_Model):
     """
     TileMatrixSetRef model.
     Based on http://docs.opengeospatial.org/per/19-069.html#_tilematrixsets
@@ -277,7 +289,7 @@ class TileMatrixSetRef(BaseModel):
     links: List[TileMatrixSetLink]
 
 
-class TileMatrixSetList(BaseModel):
+class TileMatrixSetList(_Model):
     """
     TileMatrixSetList model.
     Based on http://docs.opengeospatial.org/per/19-069.html#_tilematrixsets
@@ -294,6 +306,8 @@ class TimeStamp(RootModel):
     Code generated using https://github.com/koxudaxi/datamodel-code-generator/
     """
 
+    model_config = {"defer_build": True}
+
     root: Annotated[
         datetime,
         Field(
@@ -303,7 +317,7 @@ class TimeStamp(RootModel):
     ]
 
 
-class BoundingBox(BaseModel):
+class BoundingBox(_Model):
     """BoundingBox model.
 
     Ref: https://github.com/opengeospatial/ogcapi-tiles/blob/master/openapi/schemas/tms/2DBoundingBox.yaml
@@ -342,7 +356,7 @@ AccessConstraints = Literal[
 ]
 
 
-class Properties(BaseModel):
+class Properties(_Model):
     """Properties model.
 
     Ref: https://github.com/opengeospatial/ogcapi-tiles/blob/master/openapi/schemas/tms/propertiesSchema.yaml
@@ -398,7 +412,7 @@ class Properties(BaseModel):
     uomURI: Optional[AnyUrl] = None
 
 
-class PropertiesSchema(BaseModel):
+class PropertiesSchema(_Model):
     """PropertiesSchema model.
 
     Ref: https://github.com/opengeospatial/ogcapi-tiles/blob/master/openapi/schemas/tms/propertiesSchema.yaml
@@ -417,7 +431,7 @@ class PropertiesSchema(BaseModel):
     properties: Dict[str, Properties]
 
 
-class Style(BaseModel):
+class Style(_Model):
     """Style model.
 
     Ref: https://github.com/opengeospatial/ogcapi-tiles/blob/master/openapi/schemas/tms/style.yaml
@@ -447,7 +461,7 @@ class Style(BaseModel):
     ] = None
 
 
-class GeospatialData(BaseModel):
+class GeospatialData(_Model):
     """Geospatial model.
 
     Ref: https://github.com/opengeospatial/ogcapi-tiles/blob/master/openapi/schemas/tms/geospatialData.yaml
@@ -570,7 +584,7 @@ class GeospatialData(BaseModel):
     ] = None
 
 
-class TilePoint(BaseModel):
+class TilePoint(_Model):
     """TilePoint model.
 
     Ref: https://github.com/opengeospatial/ogcapi-tiles/blob/master/openapi/schemas/tms/tilePoint.yaml
@@ -593,7 +607,7 @@ class TilePoint(BaseModel):
     ] = None
 
 
-class TileMatrixLimits(BaseModel):
+class TileMatrixLimits(_Model):
     """
     The limits for an individual tile matrix of a TileSet's TileMatrixSet, as defined in the OGC 2D TileMatrixSet and TileSet Metadata Standard
 
@@ -607,7 +621,7 @@ class TileMatrixLimits(BaseModel):
     maxTileCol: Annotated[int, Field(ge=0)]
 
 
-class TileSet(BaseModel):
+class TileSet(_Model):
     """
     TileSet model.
 
@@ -687,7 +701,7 @@ class TileSet(BaseModel):
     ] = None
 
 
-class TileSetList(BaseModel):
+class TileSetList(_Model):
     """
     TileSetList model.
 
@@ -702,7 +716,7 @@ NumType = Union[float, int]
 BoundsType = Tuple[NumType, NumType]
 
 
-class TMSBoundingBox(BaseModel, arbitrary_types_allowed=True):
+class TMSBoundingBox(_Model, arbitrary_types_allowed=True):
     """Bounding box
 
     ref: https://github.com/opengeospatial/2D-Tile-Matrix-Set/blob/master/schemas/tms/2.0/json/2DBoundingBox.json
@@ -727,7 +741,7 @@ class TMSBoundingBox(BaseModel, arbitrary_types_allowed=True):
     ] = None
 
 
-class variableMatrixWidth(BaseModel):
+class variableMatrixWidth(_Model):
     """Variable Matrix Width Definition
 
     ref: https://github.com/opengeospatial/2D-Tile-Matrix-Set/blob/master/schemas/tms/2.0/json/variableMatrixWidth.json
@@ -759,7 +773,7 @@ class variableMatrixWidth(BaseModel):
     ]
 
 
-class TileMatrix(BaseModel, extra="forbid"):
+class TileMatrix(_Model, extra="forbid"):
     """Tile Matrix Definition
 
     A tile matrix, usually corresponding to a particular zoom level of a TileMatrixSet.
@@ -850,7 +864,7 @@ class TileMatrix(BaseModel, extra="forbid"):
     ] = None
 
 
-class TileMatrixSet(BaseModel, arbitrary_types_allowed=True):
+class TileMatrixSet(_Model, arbitrary_types_allowed=True):
     """Tile Matrix Set Definition
 
     A definition of a tile matrix set following the Tile Matrix Set standard.
@@ -0,0 +1,16 @@
+"""titiler-cmr responses."""
+
+from fastapi.responses import ORJSONResponse
+
+from titiler.cmr.enums import MediaType
+
+
+class GeoJSONResponse(ORJSONResponse):
+    """GeoJSON Response.
+
+    orjson serializes NaN and Infinity as `null`, like titiler.core's simplejson
+    based GeoJSONResponse.
+
+    """
+
+    media_type = MediaType.geojson.value
@@ -1,6 +1,6 @@
 """API settings."""
 
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
@@ -16,6 +16,9 @@ class ApiSettings(BaseSettings):
     root_path: str = ""
     debug: bool = False
 
+    # Directory to store the compiled templates in (no bytecode cache if not set)
+    template_cache_dir: Optional[str] = None
+
     model_config = {
         "env_prefix": "TITILER_CMR_API_",
         "env_file": ".env",
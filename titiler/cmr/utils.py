@@ -19,16 +19,17 @@ def retry(
         def _newfn(*args: Any, **kwargs: Any):
 
             attempt = 0
-            while attempt < tries:
+            while True:
                 try:
                     return func(*args, **kwargs)
 
                 except exceptions:  # type: ignore
-
                     attempt += 1
-                    time.sleep(delay)
+                    if attempt > tries:
+                        raise
 
-            return func(*args, **kwargs)
+                    if delay:
+                        time.sleep(delay)
 
         return _newfn
 